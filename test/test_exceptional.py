@@ -234,5 +234,40 @@ class TestAssignment(unittest.TestCase):
             self.test_obj.yakshaAssert("TestInvalidInputHandling", False, "exception")
             print("TestInvalidInputHandling = Failed")
 
+    def test_unhashable_input_handling(self):
+        """Test that unhashable inputs raise ValueError rather than TypeError"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestUnhashableInputHandling", False, "exception")
+                print("TestUnhashableInputHandling = Failed")
+                return
+                
+            tickets = safely_call_function(self.module_obj, 'initialize_data')[0]
+            all_errors = []
+            
+            invalid_calls = [
+                ("add_ticket() with list type", lambda: self.module_obj.add_ticket([], {"id": "T999", "title": "Invalid", "type": ["billing"], "priority": 2, "status": "new"})),
+                ("add_ticket() with list status", lambda: self.module_obj.add_ticket([], {"id": "T999", "title": "Invalid", "type": "billing", "priority": 2, "status": ["new"]})),
+                ("sort_tickets() with list key", lambda: self.module_obj.sort_tickets(tickets, ["id"])),
+                ("filter_tickets() with list filter type", lambda: self.module_obj.filter_tickets(tickets, ["type"], "billing")),
+                ("manage_queue() with list operation", lambda: self.module_obj.manage_queue(tickets, [], ["add"], 0)),
+                ("update_ticket() with list field", lambda: self.module_obj.update_ticket(tickets, 0, ["status"], "open")),
+                ("update_ticket() with list status", lambda: self.module_obj.update_ticket(tickets, 0, "status", ["open"]))
+            ]
+            
+            for description, call in invalid_calls:
+                if not check_raises(call, [], ValueError):
+                    all_errors.append(f"{description} should raise ValueError")
+                    
+            if all_errors:
+                self.test_obj.yakshaAssert("TestUnhashableInputHandling", False, "exception")
+                print("TestUnhashableInputHandling = Failed")
+            else:
+                self.test_obj.yakshaAssert("TestUnhashableInputHandling", True, "exception")
+                print("TestUnhashableInputHandling = Passed")
+        except Exception as e:
+            self.test_obj.yakshaAssert("TestUnhashableInputHandling", False, "exception")
+            print("TestUnhashableInputHandling = Failed")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
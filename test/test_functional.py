@@ -698,5 +698,219 @@ class TestAssignment(unittest.TestCase):
             self.test_obj.yakshaAssert("TestDisplayFunctions", False, "functional")
             print("TestDisplayFunctions = Failed")
 
+    def test_ticket_index(self):
+        """Test mapping ticket IDs to list positions"""
+        try:
+            if self.module_obj is None or not check_function_exists(self.module_obj, 'build_ticket_index'):
+                self.test_obj.yakshaAssert("TestTicketIndex", False, "functional")
+                print("TestTicketIndex = Failed")
+                return
+                
+            tickets = safely_call_function(self.module_obj, 'initialize_data')[0]
+            all_errors = []
+            
+            ticket_index = safely_call_function(self.module_obj, 'build_ticket_index', tickets)
+            if ticket_index != {ticket["id"]: i for i, ticket in enumerate(tickets)}:
+                all_errors.append("build_ticket_index() should map every ticket ID to its index")
+                
+            # Removing a ticket shifts the positions of every later ticket
+            safely_call_function(self.module_obj, 'remove_ticket', tickets, 1)
+            ticket_index = safely_call_function(self.module_obj, 'build_ticket_index', tickets)
+            
+            if ticket_index is None:
+                all_errors.append("build_ticket_index() returned None after a remove")
+            elif "T002" in ticket_index:
+                all_errors.append("Removed ticket should not remain in the index")
+            elif len(ticket_index) != len(tickets):
+                all_errors.append(f"Index should have {len(tickets)} entries, got {len(ticket_index)}")
+            elif any(tickets[index]["id"] != ticket_id for ticket_id, index in ticket_index.items()):
+                all_errors.append("Every indexed position should hold the ticket with that ID")
+                
+            if all_errors:
+                self.test_obj.yakshaAssert("TestTicketIndex", False, "functional")
+                print("TestTicketIndex = Failed")
+            else:
+                self.test_obj.yakshaAssert("TestTicketIndex", True, "functional")
+                print("TestTicketIndex = Passed")
+        except Exception as e:
+            self.test_obj.yakshaAssert("TestTicketIndex", False, "functional")
+            print("TestTicketIndex = Failed")
+
+    def test_combined_queue_display(self):
+        """Test displaying combined queues through an iterator"""
+        try:
+            required_functions = ['combine_queues_iter', 'display_data']
+            if self.module_obj is None or not all(check_function_exists(self.module_obj, name) for name in required_functions):
+                self.test_obj.yakshaAssert("TestCombinedQueueDisplay", False, "functional")
+                print("TestCombinedQueueDisplay = Failed")
+                return
+                
+            tickets, escalated, _ = safely_call_function(self.module_obj, 'initialize_data')
+            all_errors = []
+            
+            combined = list(self.module_obj.combine_queues_iter(tickets, escalated))
+            if combined != tickets + escalated:
+                all_errors.append("combine_queues_iter() should yield tickets1 followed by tickets2")
+                
+            # Display the combined tickets straight from the iterator
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.module_obj.display_data(self.module_obj.combine_queues_iter(tickets, escalated))
+            lines = output.getvalue().splitlines()
+            
+            if len(lines) != len(tickets) + len(escalated) + 1:
+                all_errors.append(f"Expected a header and {len(tickets) + len(escalated)} ticket lines, got {len(lines)} lines")
+            elif not all(ticket["id"] in line for ticket, line in zip(tickets + escalated, lines[1:])):
+                all_errors.append("Displayed tickets should follow the combined queue order")
+                
+            # An empty iterator has nothing to show
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.module_obj.display_data(self.module_obj.combine_queues_iter([], []))
+            if output.getvalue().strip() != "No tickets to display.":
+                all_errors.append("display_data() should report an empty iterator as having no tickets")
+                
+            # None and empty lists have nothing to show either
+            for empty in (None, []):
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    self.module_obj.display_data(empty)
+                if output.getvalue().strip() != "No tickets to display.":
+                    all_errors.append(f"display_data({empty!r}) should report no tickets to display")
+                
+            if all_errors:
+                self.test_obj.yakshaAssert("TestCombinedQueueDisplay", False, "functional")
+                print("TestCombinedQueueDisplay = Failed")
+            else:
+                self.test_obj.yakshaAssert("TestCombinedQueueDisplay", True, "functional")
+                print("TestCombinedQueueDisplay = Passed")
+        except Exception as e:
+            self.test_obj.yakshaAssert("TestCombinedQueueDisplay", False, "functional")
+            print("TestCombinedQueueDisplay = Failed")
+
+    def test_bulk_ticket_add(self):
+        """Test adding several tickets at once"""
+        try:
+            if self.module_obj is None or not check_function_exists(self.module_obj, 'add_tickets'):
+                self.test_obj.yakshaAssert("TestBulkTicketAdd", False, "functional")
+                print("TestBulkTicketAdd = Failed")
+                return
+                
+            tickets, escalated, _ = safely_call_function(self.module_obj, 'initialize_data')
+            original_len = len(tickets)
+            all_errors = []
+            
+            # Add a valid batch
+            result = safely_call_function(self.module_obj, 'add_tickets', tickets, escalated)
+            
+            if result is None:
+                all_errors.append("add_tickets() returned None instead of the updated list")
+            elif result is not tickets:
+                all_errors.append("add_tickets() should return the same list it extended")
+            elif tickets[original_len:] != escalated:
+                all_errors.append("add_tickets() should append the new tickets in order")
+                
+            # An invalid ticket mid-batch leaves the list unchanged
+            batch = [
+                {"id": "T100", "title": "Valid ticket", "type": "general", "priority": 3, "status": "new"},
+                {"id": "T101", "title": "Invalid ticket", "type": "general", "priority": 9, "status": "new"},
+                {"id": "T102", "title": "Valid ticket", "type": "billing", "priority": 2, "status": "open"}
+            ]
+            before = list(tickets)
+            
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    self.module_obj.add_tickets(tickets, batch)
+                all_errors.append("add_tickets() should raise ValueError for an invalid ticket")
+            except ValueError:
+                if tickets != before:
+                    all_errors.append("An invalid ticket mid-batch should leave the list unchanged")
+                    
+            if all_errors:
+                self.test_obj.yakshaAssert("TestBulkTicketAdd", False, "functional")
+                print("TestBulkTicketAdd = Failed")
+            else:
+                self.test_obj.yakshaAssert("TestBulkTicketAdd", True, "functional")
+                print("TestBulkTicketAdd = Passed")
+        except Exception as e:
+            self.test_obj.yakshaAssert("TestBulkTicketAdd", False, "functional")
+            print("TestBulkTicketAdd = Failed")
+
+    def test_priority_count(self):
+        """Test counting tickets by priority"""
+        try:
+            required_functions = ['count_priority', 'get_priority_tickets']
+            if self.module_obj is None or not all(check_function_exists(self.module_obj, name) for name in required_functions):
+                self.test_obj.yakshaAssert("TestPriorityCount", False, "functional")
+                print("TestPriorityCount = Failed")
+                return
+                
+            tickets = safely_call_function(self.module_obj, 'initialize_data')[0]
+            all_errors = []
+            
+            for level in range(1, 5):
+                count = safely_call_function(self.module_obj, 'count_priority', tickets, level)
+                expected = len(self.module_obj.get_priority_tickets(tickets, level))
+                if count != expected:
+                    all_errors.append(f"count_priority() for level {level} should be {expected}, got {count}")
+                    
+            for level in (0, 5, "1"):
+                try:
+                    self.module_obj.count_priority(tickets, level)
+                    all_errors.append(f"count_priority() should raise ValueError for level {level!r}")
+                except ValueError:
+                    pass
+                    
+            if all_errors:
+                self.test_obj.yakshaAssert("TestPriorityCount", False, "functional")
+                print("TestPriorityCount = Failed")
+            else:
+                self.test_obj.yakshaAssert("TestPriorityCount", True, "functional")
+                print("TestPriorityCount = Passed")
+        except Exception as e:
+            self.test_obj.yakshaAssert("TestPriorityCount", False, "functional")
+            print("TestPriorityCount = Failed")
+
+    def test_category_string_subclasses(self):
+        """Test that str subclasses for type and status are accepted and stored as plain strings"""
+        try:
+            if self.module_obj is None:
+                self.test_obj.yakshaAssert("TestCategoryStringSubclasses", False, "functional")
+                print("TestCategoryStringSubclasses = Failed")
+                return
+                
+            class TaggedStr(str):
+                pass
+                
+            all_errors = []
+            
+            try:
+                ticket = {"id": "T200", "title": "Subclass values", "type": TaggedStr("billing"), "priority": 2, "status": TaggedStr("open")}
+                tickets = self.module_obj.add_ticket([], ticket)
+                if type(tickets[0]["type"]) is not str or tickets[0]["type"] != "billing":
+                    all_errors.append("add_ticket() should store the type as the plain string 'billing'")
+                if type(tickets[0]["status"]) is not str or tickets[0]["status"] != "open":
+                    all_errors.append("add_ticket() should store the status as the plain string 'open'")
+                    
+                updated = self.module_obj.update_ticket(tickets, 0, "type", TaggedStr("account"))
+                if type(updated["type"]) is not str or updated["type"] != "account":
+                    all_errors.append("update_ticket() should store the type as the plain string 'account'")
+                    
+                updated = self.module_obj.update_ticket(tickets, 0, "status", TaggedStr("closed"))
+                if type(updated["status"]) is not str or updated["status"] != "closed":
+                    all_errors.append("update_ticket() should store the status as the plain string 'closed'")
+            except Exception as e:
+                all_errors.append(f"str subclass values should be accepted: {str(e)}")
+                
+            if all_errors:
+                self.test_obj.yakshaAssert("TestCategoryStringSubclasses", False, "functional")
+                print("TestCategoryStringSubclasses = Failed")
+            else:
+                self.test_obj.yakshaAssert("TestCategoryStringSubclasses", True, "functional")
+                print("TestCategoryStringSubclasses = Passed")
+        except Exception as e:
+            self.test_obj.yakshaAssert("TestCategoryStringSubclasses", False, "functional")
+            print("TestCategoryStringSubclasses = Failed")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -13,6 +13,41 @@ Each ticket has the following attributes:
 - status: Current state of the ticket (new, open, resolved, closed)
 """
 
+from itertools import chain
+from operator import itemgetter
+
+# Validation tables, built once at import rather than on every call
+_TICKET_TYPES = ("technical", "billing", "general", "account", "feature")
+_TICKET_STATUSES = ("new", "open", "resolved", "closed")
+_UPDATE_FIELDS = ("status", "priority", "type")
+_SORT_KEYS = ("id", "priority", "status", "type")
+_FILTER_TYPES = ("type", "status", "priority", "keyword")
+_QUEUE_OPERATIONS = ("add", "remove", "clear")
+_REQUIRED_FIELDS = ("id", "title", "type", "priority", "status")
+_QUEUE_CAPACITY = 5
+
+_VALID_SORT_KEYS = frozenset(_SORT_KEYS)
+_VALID_FILTERS = frozenset(_FILTER_TYPES)
+_VALID_OPERATIONS = frozenset(_QUEUE_OPERATIONS)
+
+# Each accepted type/status mapped to its literal, so one lookup both
+# validates a value and swaps in the shared canonical string
+_CANONICAL_TYPES = {ticket_type: ticket_type for ticket_type in _TICKET_TYPES}
+_CANONICAL_STATUSES = {status: status for status in _TICKET_STATUSES}
+
+_TICKET_TYPE_MSG = f"Invalid ticket type. Must be one of: {', '.join(_TICKET_TYPES)}"
+_TYPE_MSG = f"Invalid type. Must be one of: {', '.join(_TICKET_TYPES)}"
+_STATUS_MSG = f"Invalid status. Must be one of: {', '.join(_TICKET_STATUSES)}"
+_FIELD_MSG = f"Invalid field. Must be one of: {', '.join(_UPDATE_FIELDS)}"
+_SORT_KEY_MSG = f"Invalid sort key. Must be one of: {', '.join(_SORT_KEYS)}"
+_FILTER_MSG = f"Invalid filter type. Must be one of: {', '.join(_FILTER_TYPES)}"
+_OPERATION_MSG = f"Invalid operation. Must be one of: {', '.join(_QUEUE_OPERATIONS)}"
+_QUEUE_FULL_MSG = f"Active queue is at maximum capacity ({_QUEUE_CAPACITY} tickets)"
+
+# Display helpers
+_PRIORITY_INDICATORS = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+_EMPTY = object()  # Sentinel for "no first ticket" when display_data peeks
+
 def initialize_data():
     """
     Initialize the system with predefined ticket data.
@@ -52,28 +87,62 @@ def add_ticket(tickets, ticket):
     Raises:
         ValueError: If ticket is missing required fields or has invalid values
     """
-    # Validate ticket structure
-    required_fields = ["id", "title", "type", "priority", "status"]
-    for field in required_fields:
-        if field not in ticket:
-            raise ValueError(f"Ticket is missing required field: {field}")
+    return add_tickets(tickets, (ticket,))
+
+def add_tickets(tickets, new_tickets):
+    """
+    Add several tickets to the ticket list in one pass.
     
-    # Validate ticket type
-    valid_types = ["technical", "billing", "general", "account", "feature"]
-    if ticket["type"] not in valid_types:
-        raise ValueError(f"Invalid ticket type. Must be one of: {', '.join(valid_types)}")
+    Every ticket is validated before any of them is added, so an invalid
+    ticket leaves the list unchanged. Valid tickets have their type and
+    status replaced by the canonical strings.
     
-    # Validate priority (1-4)
-    if not isinstance(ticket["priority"], int) or ticket["priority"] < 1 or ticket["priority"] > 4:
-        raise ValueError("Priority must be an integer between 1 and 4")
+    Args:
+        tickets (list): The current list of tickets
+        new_tickets (iterable): The new tickets to add
+    
+    Returns:
+        list: Updated list of tickets
     
-    # Validate status
-    valid_statuses = ["new", "open", "resolved", "closed"]
-    if ticket["status"] not in valid_statuses:
-        raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
+    Raises:
+        ValueError: If any ticket is missing required fields or has invalid values
+    """
+    # Bind the validation tables to locals once for the whole loop
+    required_fields = _REQUIRED_FIELDS
+    types, statuses = _CANONICAL_TYPES, _CANONICAL_STATUSES
+    
+    # Validate everything before extending, so one-shot iterables are
+    # materialized first
+    if not isinstance(new_tickets, (list, tuple)):
+        new_tickets = list(new_tickets)
+    
+    for ticket in new_tickets:
+        # Validate ticket structure
+        for field in required_fields:
+            if field not in ticket:
+                raise ValueError(f"Ticket is missing required field: {field}")
+        
+        # Validate ticket type; unhashable values fail the lookup with TypeError
+        try:
+            ticket_type = types[ticket["type"]]
+        except (KeyError, TypeError):
+            raise ValueError(_TICKET_TYPE_MSG)
+        
+        # Validate priority (1-4)
+        priority = ticket["priority"]
+        if not isinstance(priority, int) or priority < 1 or priority > 4:
+            raise ValueError("Priority must be an integer between 1 and 4")
+        
+        # Validate status
+        try:
+            status = statuses[ticket["status"]]
+        except (KeyError, TypeError):
+            raise ValueError(_STATUS_MSG)
+        
+        ticket["type"] = ticket_type
+        ticket["status"] = status
     
-    # Add the ticket to the list
-    tickets.append(ticket)
+    tickets.extend(new_tickets)
     return tickets
 
 def remove_ticket(tickets, index):
@@ -109,17 +178,15 @@ def sort_tickets(tickets, key):
     Raises:
         ValueError: If the key is invalid
     """
-    valid_keys = ["id", "priority", "status", "type"]
-    if key not in valid_keys:
-        raise ValueError(f"Invalid sort key. Must be one of: {', '.join(valid_keys)}")
-    
-    # Make a copy to avoid modifying the original list
-    sorted_tickets = tickets.copy()
-    
-    # Sort by the specified key
-    sorted_tickets.sort(key=lambda ticket: ticket[key])
-    
-    return sorted_tickets
+    # Unhashable keys fail the set lookup with TypeError; report them the same way
+    try:
+        if key not in _VALID_SORT_KEYS:
+            raise ValueError(_SORT_KEY_MSG)
+    except TypeError:
+        raise ValueError(_SORT_KEY_MSG)
+    
+    # sorted() builds a new list, leaving the original untouched
+    return sorted(tickets, key=itemgetter(key))
 
 def filter_tickets(tickets, filter_type, value):
     """
@@ -136,9 +203,11 @@ def filter_tickets(tickets, filter_type, value):
     Raises:
         ValueError: If the filter type is invalid
     """
-    valid_filters = ["type", "status", "priority", "keyword"]
-    if filter_type not in valid_filters:
-        raise ValueError(f"Invalid filter type. Must be one of: {', '.join(valid_filters)}")
+    try:
+        if filter_type not in _VALID_FILTERS:
+            raise ValueError(_FILTER_MSG)
+    except TypeError:
+        raise ValueError(_FILTER_MSG)
     
     if filter_type == "keyword":
         # Search for keyword in title using list comprehension
@@ -172,6 +241,24 @@ def combine_queues(tickets1, tickets2):
     # Create a new list with all tickets from both lists using the + operator
     return tickets1 + tickets2
 
+def combine_queues_iter(tickets1, tickets2):
+    """
+    Iterate over two ticket queues in order without building a new list.
+    
+    Args:
+        tickets1 (list): First list of tickets
+        tickets2 (list): Second list of tickets
+    
+    Returns:
+        iterator: Tickets from the first list followed by the second
+    """
+    return chain(tickets1, tickets2)
+
+def _check_priority_level(priority_level):
+    """Raise ValueError unless priority_level is an integer from 1 to 4."""
+    if not isinstance(priority_level, int) or priority_level < 1 or priority_level > 4:
+        raise ValueError("Priority level must be between 1 and 4")
+
 def get_priority_tickets(tickets, priority_level):
     """
     Get tickets with a specific priority level.
@@ -186,12 +273,29 @@ def get_priority_tickets(tickets, priority_level):
     Raises:
         ValueError: If priority level is invalid
     """
-    if not isinstance(priority_level, int) or priority_level < 1 or priority_level > 4:
-        raise ValueError("Priority level must be between 1 and 4")
+    _check_priority_level(priority_level)
     
     # Use list comprehension to filter by priority
     return [ticket for ticket in tickets if ticket["priority"] == priority_level]
 
+def count_priority(tickets, priority_level):
+    """
+    Count tickets with a specific priority level without building a list.
+    
+    Args:
+        tickets (list): The list of tickets
+        priority_level (int): The priority level to count (1-4)
+    
+    Returns:
+        int: Number of tickets with the specified priority
+    
+    Raises:
+        ValueError: If priority level is invalid
+    """
+    _check_priority_level(priority_level)
+    
+    return sum(1 for ticket in tickets if ticket["priority"] == priority_level)
+
 def manage_queue(tickets, active_queue, operation, index=None):
     """
     Manage the active queue of tickets being worked on.
@@ -209,9 +313,11 @@ def manage_queue(tickets, active_queue, operation, index=None):
         ValueError: If operation is invalid or queue exceeds capacity
         IndexError: If index is out of range
     """
-    valid_operations = ["add", "remove", "clear"]
-    if operation not in valid_operations:
-        raise ValueError(f"Invalid operation. Must be one of: {', '.join(valid_operations)}")
+    try:
+        if operation not in _VALID_OPERATIONS:
+            raise ValueError(_OPERATION_MSG)
+    except TypeError:
+        raise ValueError(_OPERATION_MSG)
     
     if operation == "add":
         if index is None:
@@ -220,9 +326,9 @@ def manage_queue(tickets, active_queue, operation, index=None):
         if index < 0 or index >= len(tickets):
             raise IndexError("Ticket index out of range")
         
-        # Check queue capacity (maximum 5 tickets)
-        if len(active_queue) >= 5:
-            raise ValueError("Active queue is at maximum capacity (5 tickets)")
+        # Check queue capacity
+        if len(active_queue) >= _QUEUE_CAPACITY:
+            raise ValueError(_QUEUE_FULL_MSG)
         
         active_queue.append(tickets[index])
     
@@ -240,6 +346,37 @@ def manage_queue(tickets, active_queue, operation, index=None):
     
     return active_queue
 
+def _set_status(ticket, value):
+    """Validate and assign a new status to a ticket."""
+    try:
+        ticket["status"] = _CANONICAL_STATUSES[value]
+    except (KeyError, TypeError):
+        raise ValueError(_STATUS_MSG)
+
+def _set_priority(ticket, value):
+    """Validate and assign a new priority (1-4) to a ticket."""
+    try:
+        priority = int(value)
+        if priority < 1 or priority > 4:
+            raise ValueError()
+    except ValueError:
+        raise ValueError("Priority must be an integer between 1 and 4")
+    ticket["priority"] = priority
+
+def _set_type(ticket, value):
+    """Validate and assign a new type to a ticket."""
+    try:
+        ticket["type"] = _CANONICAL_TYPES[value]
+    except (KeyError, TypeError):
+        raise ValueError(_TYPE_MSG)
+
+# Updatable fields mapped to the setter that validates and assigns them
+_FIELD_SETTERS = {
+    "status": _set_status,
+    "priority": _set_priority,
+    "type": _set_type
+}
+
 def update_ticket(tickets, index, field, value):
     """
     Update a specific field of a ticket.
@@ -260,34 +397,28 @@ def update_ticket(tickets, index, field, value):
     if index < 0 or index >= len(tickets):
         raise IndexError("Ticket index out of range")
     
-    valid_fields = ["status", "priority", "type"]
-    if field not in valid_fields:
-        raise ValueError(f"Invalid field. Must be one of: {', '.join(valid_fields)}")
+    # The setter lookup doubles as the field name check
+    try:
+        setter = _FIELD_SETTERS[field]
+    except (KeyError, TypeError):
+        raise ValueError(_FIELD_MSG)
     
     ticket = tickets[index]
+    setter(ticket, value)
     
-    if field == "status":
-        valid_statuses = ["new", "open", "resolved", "closed"]
-        if value not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
-        ticket["status"] = value
-    
-    elif field == "priority":
-        try:
-            priority = int(value)
-            if priority < 1 or priority > 4:
-                raise ValueError()
-        except ValueError:
-            raise ValueError("Priority must be an integer between 1 and 4")
-        ticket["priority"] = priority
+    return ticket
+
+def build_ticket_index(tickets):
+    """
+    Map each ticket ID to its position in the ticket list.
     
-    elif field == "type":
-        valid_types = ["technical", "billing", "general", "account", "feature"]
-        if value not in valid_types:
-            raise ValueError(f"Invalid type. Must be one of: {', '.join(valid_types)}")
-        ticket["type"] = value
+    Args:
+        tickets (list): The list of tickets
     
-    return ticket
+    Returns:
+        dict: Ticket IDs mapped to their index in the list
+    """
+    return {ticket["id"]: index for index, ticket in enumerate(tickets)}
 
 def get_formatted_ticket(ticket):
     """
@@ -300,8 +431,7 @@ def get_formatted_ticket(ticket):
         str: Formatted ticket string
     """
     # Get priority level text
-    priority_indicators = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
-    priority_text = priority_indicators[ticket["priority"] - 1]
+    priority_text = _PRIORITY_INDICATORS[ticket["priority"] - 1]
     
     # Get status indicator
     status_text = ticket["status"].upper()
@@ -313,10 +443,17 @@ def display_data(data, data_type="tickets"):
     Display ticket data or queue.
     
     Args:
-        data (list): The data to display
+        data (iterable): The tickets to display
         data_type (str): The type of data (tickets, queue, filtered)
     """
-    if not data:
+    # None and empty sequences are falsy; iterators are always truthy, so
+    # peek at their first ticket instead
+    first = _EMPTY
+    if data:
+        data = iter(data)
+        first = next(data, _EMPTY)
+    
+    if first is _EMPTY:
         print("No tickets to display.")
         return
     
@@ -327,22 +464,22 @@ def display_data(data, data_type="tickets"):
     elif data_type == "filtered":
         print("Filtered Results:")
     
-    for ticket in data:
-        print(get_formatted_ticket(ticket))
+    # Join every line first so the whole listing goes out in one write
+    print("\n".join(map(get_formatted_ticket, chain((first,), data))))
 
 def main():
     """
     Main program function.
     """
     tickets, escalated, active_queue = initialize_data()
+    ticket_index = build_ticket_index(tickets)
     
     # Display welcome message
     print("===== TICKET TRACKING SYSTEM =====")
     print(f"Total Tickets: {len(tickets)}")
     
     # Display critical tickets
-    critical_tickets = get_priority_tickets(tickets, 1)
-    print(f"Critical Tickets: {len(critical_tickets)}")
+    print(f"Critical Tickets: {count_priority(tickets, 1)}")
     
     running = True
     while running:
@@ -369,6 +506,13 @@ def main():
             if op == "add":
                 # Get ticket details
                 id = input("Enter ticket ID: ")
+                
+                # IDs must stay unique across both lists so every ticket remains
+                # reachable by ID, including after escalated tickets are merged in
+                if id in ticket_index or any(ticket["id"] == id for ticket in escalated):
+                    print(f"Error: Ticket ID {id} already exists.")
+                    continue
+                
                 title = input("Enter title: ")
                 ticket_type = input("Enter type (technical, billing, general, account, feature): ")
                 priority = int(input("Enter priority (1-4): "))
@@ -385,6 +529,7 @@ def main():
                 
                 try:
                     add_ticket(tickets, new_ticket)
+                    ticket_index[new_ticket["id"]] = len(tickets) - 1
                     print("Ticket added successfully.")
                 except ValueError as e:
                     print(f"Error: {e}")
@@ -398,6 +543,7 @@ def main():
                 
                 try:
                     removed = remove_ticket(tickets, index)
+                    ticket_index = build_ticket_index(tickets)
                     print(f"Removed ticket: {removed['id']} - {removed['title']}")
                 except IndexError:
                     print("Error: Invalid index.")
@@ -475,26 +621,28 @@ def main():
         elif choice == "6":
             # Process escalated tickets
             print(f"Processing {len(escalated)} escalated tickets...")
-            combined = combine_queues(tickets, escalated)
-            print(f"Combined ticket count: {len(combined)}")
+            print(f"Combined ticket count: {len(tickets) + len(escalated)}")
             
-            # Display combined tickets
-            display_data(combined)
+            # Display combined tickets without copying them into a new list
+            display_data(combine_queues_iter(tickets, escalated))
             
             # Update tickets to include escalated
             confirm = input("Update main ticket list to include escalated? (y/n): ")
             if confirm.lower() == "y":
-                tickets = combined
+                tickets = combine_queues(tickets, escalated)
+                ticket_index = build_ticket_index(tickets)
                 escalated = []
                 print("Main ticket list updated.")
         
         elif choice == "7":
             # Update ticket
-            # Display tickets with indices
-            for i, ticket in enumerate(tickets):
-                print(f"{i}: {ticket['id']} - {ticket['title']}")
+            ticket_id = input("Enter ticket ID to update: ")
+            index = ticket_index.get(ticket_id)
+            
+            if index is None:
+                print(f"Error: No ticket with ID {ticket_id}.")
+                continue
             
-            index = int(input("Enter index to update: "))
             field = input("Enter field to update (status, priority, type): ")
             value = input("Enter new value: ")
             